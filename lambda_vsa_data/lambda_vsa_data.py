@@ -1,224 +1,423 @@
 import pygsheets
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp, Request
 import psycopg2
-from psycopg2 import extras
+from psycopg2 import sql
 from pprint import pprint
 import boto3
 import json
 from botocore.exceptions import ClientError
-import tempfile
+import logging
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# The Secrets Manager client and secret values live at module scope so that warm
+# Lambda invocations reuse them instead of calling Secrets Manager again
+SECRETS_REGION = 'us-east-1'
+SECRET_CACHE_TTL_SECONDS = 3600
+_BOTO_SESSION = boto3.session.Session()
+_SM_CLIENT = _BOTO_SESSION.client(
+    service_name='secretsmanager',
+    region_name=SECRETS_REGION
+)
+_SECRET_CACHE = {}
+
+def _get_cached_secret(secret_name):
+    """
+    Return a cached secret value, or None if it is missing or older than the TTL.
+    """
+    cached = _SECRET_CACHE.get(secret_name)
+    if cached and time.time() - cached[0] < SECRET_CACHE_TTL_SECONDS:
+        return cached[1]
+    return None
+
+def _cache_secret(secret_name, secret):
+    """
+    Parse a SecretString and store it in the secret cache.
+
+    :return: The parsed secret value
+    """
+    value = json.loads(secret) if secret.startswith('{') else secret
+    _SECRET_CACHE[secret_name] = (time.time(), value)
+    return value
 
-def get_secrets(secret_name, region_name):
+def get_secrets(secret_name):
     """
     Retrieve secrets from AWS Secrets Manager.
     The credentials for Google Sheets and Databnase are stored here.
+    Values are cached for SECRET_CACHE_TTL_SECONDS across warm invocations.
 
     :param secret_name: Name of the secret in AWS Secrets Manager.
-    :param region_name: AWS region where the secret is stored.
     :return: Dictionary containing the secret key-value
     """
-    boto3_session = boto3.session.Session()
-    client = boto3_session.client(
-        service_name='secretsmanager',
-        region_name=region_name
-    )
-    response = client.get_secret_value(SecretId=secret_name)
-    secret = response['SecretString']
-    return json.loads(secret) if secret.startswith('{') else secret
+    secret = _get_cached_secret(secret_name)
+    if secret is not None:
+        return secret
+
+    response = _SM_CLIENT.get_secret_value(SecretId=secret_name)
+    return _cache_secret(secret_name, response['SecretString'])
 
-def read_google_sheet_data(sheet_url, worksheet_name, credentials, gapi_sheets_token):
+def get_secrets_batch(secret_names):
     """
-    Reads data from a Google Sheet.
+    Retrieve several secrets from AWS Secrets Manager in a single API call.
+    Secrets still in the cache are not requested again. Falls back to one
+    get_secret_value call per secret if BatchGetSecretValue is not available.
 
-    :param sheet_url: The URL of the Google Sheet.
-    :param worksheet_name: The name of the worksheet to read from.
-    :param credentials: Google service account credentials dictionary.
-    :return: List of lists containing the rows of the worksheet.
+    :param secret_names: List of secret names in AWS Secrets Manager.
+    :return: Dictionary mapping each secret name to its value
     """
+    secrets = {}
+    missing_names = []
+    for secret_name in secret_names:
+        secret = _get_cached_secret(secret_name)
+        if secret is not None:
+            secrets[secret_name] = secret
+        else:
+            missing_names.append(secret_name)
+
+    if not missing_names:
+        return secrets
 
-    print(type(credentials))
-    
-    temp_file_path = None
-    sheets_token_path = None
-    
     try:
-        # Write client credentials to a temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            json.dump(credentials, temp_file)
-            temp_file_path = temp_file.name
+        response = _SM_CLIENT.batch_get_secret_value(SecretIdList=missing_names)
+    except (ClientError, AttributeError) as e:
+        logger.warning("BatchGetSecretValue unavailable, fetching secrets one by one: %s", e)
+        for secret_name in missing_names:
+            secrets[secret_name] = get_secrets(secret_name)
+        return secrets
+
+    if response.get('Errors'):
+        errors = ', '.join(f"{error['SecretId']}: {error['ErrorCode']}" for error in response['Errors'])
+        raise RuntimeError(f"Failed to retrieve secrets: {errors}")
+
+    # The response identifies secrets by their canonical Name and ARN, which need not match
+    # the IDs that were requested, so map each returned secret back to its requested ID
+    requested_ids = {}
+    for secret_name in missing_names:
+        requested_ids[secret_name] = secret_name
+        requested_ids.setdefault(secret_name.lower(), secret_name)
+
+    for secret_value in response['SecretValues']:
+        candidates = (secret_value.get('ARN'), secret_value['Name'], secret_value['Name'].lower())
+        secret_name = next((requested_ids[key] for key in candidates if key in requested_ids), None)
+        if secret_name is None:
+            logger.warning("Ignoring unrequested secret in batch response: %s", secret_value['Name'])
+            continue
+        secrets[secret_name] = _cache_secret(secret_name, secret_value['SecretString'])
+
+    unresolved_names = [secret_name for secret_name in missing_names if secret_name not in secrets]
+    if unresolved_names:
+        raise RuntimeError(f"Secrets Manager returned neither a value nor an error for: {', '.join(unresolved_names)}")
+    return secrets
+
+SPREADSHEET_ID_PATTERN = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)')
+
+# pygsheets' OAuth client flow reads the client secret and token from these files during authorize()
+GSHEETS_CREDENTIALS_DIRECTORY = '/tmp'
+GSHEETS_CLIENT_SECRET_PATH = os.path.join(GSHEETS_CREDENTIALS_DIRECTORY, 'client_secret.json')
+GSHEETS_TOKEN_PATH = os.path.join(GSHEETS_CREDENTIALS_DIRECTORY, 'sheets.googleapis.com-python.json')
+
+# Authorized pygsheets client, reused by every sheet read in this container
+_GSHEETS_CLIENT = None
+
+# httplib2 connections are not thread-safe, so each thread reading sheets gets its own
+GSHEETS_REQUEST_RETRIES = 3
+GSHEETS_HTTP_TIMEOUT_SECONDS = 20
+_GSHEETS_THREAD_LOCAL = threading.local()
+
+def get_gsheets_client(credentials, gapi_sheets_token):
+    """
+    Authorizes with Google Sheets once and returns the cached pygsheets client.
+
+    :param credentials: Google OAuth client credentials dictionary.
+    :param gapi_sheets_token: Previously issued Google Sheets API token dictionary.
+    :return: Authorized pygsheets client.
+    """
+    global _GSHEETS_CLIENT
+    if _GSHEETS_CLIENT is not None:
+        return _GSHEETS_CLIENT
 
-        sheets_token_path = '/tmp/sheets.googleapis.com-python.json'
-        with open(sheets_token_path, 'w') as sheets_token_file:
+    try:
+        # Write client credentials and token for pygsheets to read
+        with open(GSHEETS_CLIENT_SECRET_PATH, 'w') as client_secret_file:
+            json.dump(credentials, client_secret_file)
+
+        with open(GSHEETS_TOKEN_PATH, 'w') as sheets_token_file:
             json.dump(gapi_sheets_token, sheets_token_file)
 
-        print(f"Created temp files: {temp_file_path}, {sheets_token_path}")
+        logger.debug("Wrote %s, %s", GSHEETS_CLIENT_SECRET_PATH, GSHEETS_TOKEN_PATH)
 
         # Authorize using the credentials file
-        print("Attempting to authorize with pygsheets...")
-        gc = pygsheets.authorize(client_secret=temp_file_path, credentials_directory='/tmp')
-        print("Authorization successful")
-        
-        print(f"Opening sheet: {sheet_url}")
-        sh = gc.open_by_url(sheet_url)
-        print(f"Opening worksheet: {worksheet_name}")
-        print(f"Opening sheet: {sheet_url}")
-        sh = gc.open_by_url(sheet_url)
-        
-        # Debug: List all available worksheets
-        print("Available worksheets:")
-        for worksheet in sh.worksheets():
-            print(f"  - '{worksheet.title}'")
-        
-        print(f"Looking for worksheet: '{worksheet_name}'")
-        wks = sh.worksheet_by_title(worksheet_name)
-        print("Getting data...")
-        data = wks.get_all_values(include_tailing_empty=False)
-        print(f"Retrieved {len(data)} rows")
-        #wks = sh.worksheet_by_title(worksheet_name)
+        logger.info("Attempting to authorize with pygsheets...")
+        _GSHEETS_CLIENT = pygsheets.authorize(
+            client_secret=GSHEETS_CLIENT_SECRET_PATH,
+            credentials_directory=GSHEETS_CREDENTIALS_DIRECTORY
+        )
+        logger.info("Authorization successful")
+
+        return _GSHEETS_CLIENT
+
+    except Exception:
+        logger.exception("Error authorizing with Google Sheets")
+        raise
+    finally:
+        # Clean up the credential files; the authorized client no longer needs them
+        for path in (GSHEETS_CLIENT_SECRET_PATH, GSHEETS_TOKEN_PATH):
+            if os.path.exists(path):
+                os.remove(path)
+                logger.debug("Cleaned up: %s", path)
+
+def _get_thread_http(gc):
+    """
+    Return an authorized HTTP transport for the current thread, creating it on first use.
+
+    :param gc: Authorized pygsheets client from get_gsheets_client().
+    :return: google_auth_httplib2.AuthorizedHttp using the client's credentials.
+    """
+    http = getattr(_GSHEETS_THREAD_LOCAL, 'http', None)
+    if http is None:
+        http = AuthorizedHttp(gc.oauth, http=httplib2.Http(timeout=GSHEETS_HTTP_TIMEOUT_SECONDS))
+        _GSHEETS_THREAD_LOCAL.http = http
+    return http
+
+def read_google_sheet_data(gc, sheet_url, worksheet_names):
+    """
+    Reads data from one or more worksheets of a Google Sheet.
+    All worksheets are fetched with a single values.batchGet request.
+    Safe to call from several threads with the same client, provided its
+    credentials were refreshed beforehand.
+
+    :param gc: Authorized pygsheets client from get_gsheets_client().
+    :param sheet_url: The URL of the Google Sheet.
+    :param worksheet_names: List of worksheet names to read from.
+    :return: Dictionary mapping each worksheet name to a list of lists containing its rows.
+    """
+    try:
+        match = SPREADSHEET_ID_PATTERN.search(sheet_url)
+        if not match:
+            raise ValueError(f"Could not find a spreadsheet ID in URL: {sheet_url}")
+        spreadsheet_id = match.group(1)
+
+        # A bare worksheet title is a valid A1 range covering the whole worksheet
+        value_ranges = ["'{}'".format(name.replace("'", "''")) for name in worksheet_names]
+
+        logger.debug("Getting data from sheet: %s, worksheets: %s", sheet_url, worksheet_names)
+        request = gc.sheet.service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=value_ranges,
+            majorDimension='ROWS'
+        )
+        response = request.execute(http=_get_thread_http(gc), num_retries=GSHEETS_REQUEST_RETRIES)
+
+        data = {}
+        for worksheet_name, value_range in zip(worksheet_names, response.get('valueRanges', [])):
+            data[worksheet_name] = value_range.get('values', [])
+            logger.debug("Retrieved %d rows from '%s'", len(data[worksheet_name]), worksheet_name)
         
         return data
         
-    except Exception as e:
-        print(f"Error reading Google Sheet: {type(e).__name__}: {str(e)}")
-        import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+    except Exception:
+        logger.exception("Error reading Google Sheet: %s", sheet_url)
         raise
-    finally:
-        # Clean up the temporary files
-        if temp_file_path and os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-            print(f"Cleaned up: {temp_file_path}")
-        if sheets_token_path and os.path.exists(sheets_token_path):
-            os.remove(sheets_token_path)
-            print(f"Cleaned up: {sheets_token_path}")
-
-def import_emp_data_to_postgres(data, db_config, table_name, unique_columns):
+
+# Bytes sent per COPY data message; psycopg2 defaults to 8 KiB
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Worksheet columns, in sheet order, for each import
+_EMP_COLUMNS = ('name', 'email', 'vsa_uspr_access', 'vsa_pe_access', 'vsa_noc_access', 'vsa_dci_access', 'vsa_sc_access')
+_APP_COLUMNS = ('name', 'owner', 'vsa_type', 'vsa_uspr', 'vsa_pe', 'vsa_noc', 'vsa_dci', 'vsa_sc')
+
+# SQL templates for the staged upsert, composed with quoted identifiers
+# Not PREPAREd: each runs once per connection, so a prepared plan would never be reused
+# The staging table takes the target's column types but none of its constraints or defaults
+_STAGE_SQL_TEMPLATE = sql.SQL(
+    "CREATE TEMP TABLE _stg ON COMMIT DROP AS "
+    "SELECT NULL::integer AS sheet_row, {cols} FROM {table} WITH NO DATA"
+)
+_COPY_SQL_TEMPLATE = sql.SQL("COPY _stg (sheet_row, {cols}) FROM STDIN")
+_UPSERT_SQL_TEMPLATE = sql.SQL(
+    "INSERT INTO {table} ({cols}) "
+    "SELECT DISTINCT ON ({uk}) {cols} FROM _stg "
+    "ORDER BY {uk}, sheet_row "
+    "ON CONFLICT ({uk}) DO UPDATE SET {updates}"
+)
+_UPDATE_COLUMN_TEMPLATE = sql.SQL("{0}=EXCLUDED.{0}")
+
+# COPY uses text format: sheet values arrive as strings, and the server parses them into
+# the staged column types just as it did the original INSERT literals
+# Backslash escapes for COPY's text format, which uses tab and newline as separators
+_COPY_TEXT_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+def validate_sheet_header(data, columns, worksheet_name):
     """
-    Imports data into a PostgreSQL database, performing an upsert (insert or update).
+    Checks that a worksheet's header row matches the expected columns, so schema
+    drift fails before any database work. Header cells are compared after
+    stripping, lowercasing and turning spaces and hyphens into underscores;
+    trailing empty header cells are ignored.
 
     :param data: List of lists containing the rows of the worksheet.
-    :param db_config: Dictionary containing database connection parameters.
-    :param table_name: The name of the table to import data into.
-    :param unique_columns: List of columns that uniquely identify a row for upsert.
+    :param columns: List of column names, in the order they appear in each row.
+    :param worksheet_name: The name of the worksheet, used in the error message.
+    :raises ValueError: If the header row is missing or does not match the columns.
     """
-    
-    # Establish connection to the PostgreSQL database
-    conn = psycopg2.connect(**db_config)
-    cursor = conn.cursor()
+    if not data:
+        raise ValueError(f"Worksheet '{worksheet_name}' is empty; expected header {list(columns)}")
 
-    columns = ['name', 'email', 'vsa_uspr_access', 'vsa_pe_access', 'vsa_noc_access', 'vsa_dci_access', 'vsa_sc_access']
-    expected_column_count = len(columns)
-    
-    # Prepare the SQL query to insert data
-    insert_query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s"
+    header = [cell.strip().lower().replace(' ', '_').replace('-', '_') for cell in data[0]]
+    while header and not header[-1]:
+        header.pop()
 
-    # Prepare the data for insertion, excluding the header row and validating row length
-    values = []
-    for i, row in enumerate(data[1:], start=2):  # Skip header, start counting from row 2
+    if header != list(columns):
+        raise ValueError(f"Schema drift in worksheet '{worksheet_name}': expected {list(columns)}, got {data[0]}")
+
+def iter_sheet_rows(data, expected_column_count):
+    """
+    Yields the worksheet rows to import, excluding the header row and empty rows.
+    Each row is prefixed with its sheet row number so duplicates resolve to the first occurrence.
+
+    :param data: List of lists containing the rows of the worksheet.
+    :param expected_column_count: Number of columns each row is normalized to.
+    :return: Generator of tuples, each the sheet row number followed by the column values.
+    """
+    skipped_count = 0
+    for i, row in enumerate(islice(data, 1, None), start=2):  # Skip header, start counting from row 2
         # Pad row with empty strings if it's too short, or truncate if too long
         normalized_row = (row + [''] * expected_column_count)[:expected_column_count]
         
         # Skip completely empty rows
         if any(cell.strip() for cell in normalized_row if cell):
-            values.append(tuple(normalized_row))
+            yield (i, *normalized_row)
         else:
-            print(f"Skipping empty row {i}")
-
-    if not values:
-        print("No valid data rows found for employee data")
-        cursor.close()
-        conn.close()
-        return
+            skipped_count += 1
 
-    # Prepare the ON CONFLICT clause for upsert
-    conflict_clause = f"ON CONFLICT ({', '.join(unique_columns)}) DO UPDATE SET "
-    update_clause = ', '.join([f"{col}=EXCLUDED.{col}" for col in columns if col not in unique_columns])
+    if skipped_count:
+        logger.info("Skipped %d empty rows", skipped_count)
 
-    # Complete the upsert query
-    upsert_query = insert_query + f" {conflict_clause} {update_clause}"
+class _CopyRowStream:
+    """
+    Read-only file-like object that renders rows as COPY text-format lines on demand,
+    so copy_expert() pulls at most one chunk of the sheet into memory at a time.
+    Text format needs no quoting: empty cells load as empty strings, and only \\N means NULL.
+    """
 
-    # Execute the upsert query
-    extras.execute_values(cursor, upsert_query, values)
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._pending = ''
+        self.row_count = 0
+
+    def read(self, size=-1):
+        chunks = [self._pending]
+        length = len(self._pending)
+        while size < 0 or length < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            line = '\t'.join(str(value).translate(_COPY_TEXT_ESCAPES) for value in row) + '\n'
+            chunks.append(line)
+            length += len(line)
+            self.row_count += 1
+
+        data = ''.join(chunks)
+        if size < 0:
+            self._pending = ''
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+def copy_upsert_rows(cursor, table_name, columns, unique_columns, rows):
+    """
+    Bulk upserts rows by COPYing them into a temporary staging table and then
+    inserting from it with ON CONFLICT. Rows that share the same unique columns
+    are reduced to the first occurrence with DISTINCT ON, since ON CONFLICT
+    cannot update the same row twice in one statement.
 
-    # Commit the transaction
-    conn.commit()
-    # Close connection
-    cursor.close()
-    conn.close()
+    :param cursor: Cursor on an open PostgreSQL connection.
+    :param table_name: The name of the table to import data into.
+    :param columns: List of column names, in the order they appear in each row.
+    :param unique_columns: List of columns that uniquely identify a row for upsert.
+    :param rows: Iterable of tuples, each the sheet row number followed by the column values.
+    :return: Number of rows sent to PostgreSQL; nothing is executed when it is 0.
+    """
+    # A schema-qualified name such as 'cloudquery.table' becomes a quoted "cloudquery"."table"
+    table = sql.Identifier(*table_name.split('.'))
+    column_list = sql.SQL(', ').join(map(sql.Identifier, columns))
+
+    # Peek at the first row so an empty sheet skips the database entirely
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return 0
+
+    cursor.execute(_STAGE_SQL_TEMPLATE.format(table=table, cols=column_list))
+
+    stream = _CopyRowStream(chain([first_row], rows))
+    cursor.copy_expert(
+        _COPY_SQL_TEMPLATE.format(cols=column_list).as_string(cursor),
+        stream,
+        size=COPY_BUFFER_SIZE
+    )
 
-def import_app_data_to_postgres(data, db_config, table_name, unique_columns):
+    # Execute the upsert query
+    update_clause = sql.SQL(', ').join(
+        _UPDATE_COLUMN_TEMPLATE.format(sql.Identifier(col)) for col in columns if col not in unique_columns
+    )
+    cursor.execute(_UPSERT_SQL_TEMPLATE.format(
+        table=table,
+        cols=column_list,
+        uk=sql.SQL(', ').join(map(sql.Identifier, unique_columns)),
+        updates=update_clause
+    ))
+
+    # Drop the staging table right away so another import can reuse the name in this transaction
+    cursor.execute("DROP TABLE _stg")
+    return stream.row_count
+
+def import_emp_data_to_postgres(data, conn, table_name, unique_columns):
     """
     Imports data into a PostgreSQL database, performing an upsert (insert or update).
 
     :param data: List of lists containing the rows of the worksheet.
-    :param db_config: Dictionary containing database connection parameters.
+    :param conn: Open PostgreSQL connection; the caller commits the transaction.
     :param table_name: The name of the table to import data into.
     :param unique_columns: List of columns that uniquely identify a row for upsert.
     """
-
-    # Establish connection to the PostgreSQL database
-    conn = psycopg2.connect(**db_config, connect_timeout=10, options='-c statement_timeout=30000')
+    
     cursor = conn.cursor()
 
-    columns = ['name', 'owner', 'vsa_type', 'vsa_uspr', 'vsa_pe', 'vsa_noc', 'vsa_dci', 'vsa_sc']
-    expected_column_count = len(columns)
+    columns = _EMP_COLUMNS
+    values = iter_sheet_rows(data, len(columns))
 
-    # Prepare the SQL query to insert data
-    insert_query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s"
+    if not copy_upsert_rows(cursor, table_name, columns, unique_columns, values):
+        logger.info("No valid data rows found for employee data")
 
-    # Prepare the data for insertion, excluding the header row and validating row length
-    raw_values = []
-    for i, row in enumerate(data[1:], start=2):  # Skip header, start counting from row 2
-        # Pad row with empty strings if it's too short, or truncate if too long
-        normalized_row = (row + [''] * expected_column_count)[:expected_column_count]
-        
-        # Skip completely empty rows
-        if any(cell.strip() for cell in normalized_row if cell):
-            raw_values.append(tuple(normalized_row))
-        else:
-            print(f"Skipping empty row {i}")
-
-    if not raw_values:
-        print("No valid data rows found for app data")
-        cursor.close()
-        conn.close()
-        return
-
-    # Remove duplicates based on unique columns
-    seen = set()
-    unique_values = []
-    for row in raw_values:
-        try:
-            unique_key = tuple(row[columns.index(col)] for col in unique_columns)
-            if unique_key not in seen:
-                seen.add(unique_key)
-                unique_values.append(row)
-        except (IndexError, ValueError) as e:
-            print(f"Error processing row {row}: {e}")
-            continue
+    cursor.close()
 
-    if not unique_values:
-        print("No valid unique data rows found for app data")
-        cursor.close()
-        conn.close()
-        return
+def import_app_data_to_postgres(data, conn, table_name, unique_columns):
+    """
+    Imports data into a PostgreSQL database, performing an upsert (insert or update).
 
-    # Prepare the ON CONFLICT clause for upsert
-    conflict_clause = f"ON CONFLICT ({', '.join(unique_columns)}) DO UPDATE SET "
-    update_clause = ', '.join([f"{col}=EXCLUDED.{col}" for col in columns if col not in unique_columns])
+    :param data: List of lists containing the rows of the worksheet.
+    :param conn: Open PostgreSQL connection; the caller commits the transaction.
+    :param table_name: The name of the table to import data into.
+    :param unique_columns: List of columns that uniquely identify a row for upsert.
+    """
 
-    # Complete the upsert query
-    upsert_query = insert_query + f" {conflict_clause} {update_clause}"
+    cursor = conn.cursor()
 
-    # Execute the upsert query
-    extras.execute_values(cursor, upsert_query, unique_values)
+    columns = _APP_COLUMNS
+    values = iter_sheet_rows(data, len(columns))
 
-    # Commit the transaction
-    conn.commit()
+    if not copy_upsert_rows(cursor, table_name, columns, unique_columns, values):
+        logger.info("No valid data rows found for app data")
 
-    # Close the cursor and connection
     cursor.close()
-    conn.close()
 
 
 def lambda_handler(event, context):
@@ -227,7 +426,6 @@ def lambda_handler(event, context):
         secret_name_gapi = 'vonage/googleapi/sheets'
         secret_name_db = 'Vonage/cloudquery/cloudquery'
         gapi_token = 'vonage/googleapi/sheets-tokens'
-        region_name = 'us-east-1'  # Update if needed
         sheet_url_emp = 'https://docs.google.com/spreadsheets/d/19vvQgQkJg0y7g_P6L4yENgOnO-vAHDsg7dOX556ZXJM/edit?usp=sharing'
         sheet_url_apps = 'https://docs.google.com/spreadsheets/d/1lAWbVaBkee1ruKvIdIly33hRLlVv4b_HlexzXu1l2kI/edit?usp=sharing'
         worksheet_name_apps = 'Current VSA Master List'
@@ -235,9 +433,10 @@ def lambda_handler(event, context):
         table_name_apps = 'cloudquery.vsa_app_classifications'
         table_name_emp = 'cloudquery.employee_vsa_attributes'
 
-        db_secrets = get_secrets(secret_name_db, region_name)
-        google_secrets = get_secrets(secret_name_gapi, region_name)
-        gapi_sheets_token = get_secrets(gapi_token, region_name)
+        secrets = get_secrets_batch([secret_name_db, secret_name_gapi, gapi_token])
+        db_secrets = secrets[secret_name_db]
+        google_secrets = secrets[secret_name_gapi]
+        gapi_sheets_token = secrets[gapi_token]
 
         # Ensure google_secrets is a dictionary
         if isinstance(google_secrets, str):
@@ -251,31 +450,47 @@ def lambda_handler(event, context):
             'port': db_secrets['port']
         }
         
-        # Read data from Google Sheets
-        data_emp = read_google_sheet_data(sheet_url_emp, worksheet_name_emp, google_secrets, gapi_sheets_token)
-        data_apps = read_google_sheet_data(sheet_url_apps, worksheet_name_apps, google_secrets, gapi_sheets_token)
+        # Read data from Google Sheets, authorizing once and reading both spreadsheets concurrently
+        gc = get_gsheets_client(google_secrets, gapi_sheets_token)
+
+        # Refresh an expired token here, so the reader threads only read the shared credentials
+        if not gc.oauth.valid:
+            gc.oauth.refresh(Request(httplib2.Http(timeout=GSHEETS_HTTP_TIMEOUT_SECONDS)))
 
-        # Print data to verify
-        for row in data_emp:
-            print(row)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_emp = executor.submit(read_google_sheet_data, gc, sheet_url_emp, [worksheet_name_emp])
+            future_apps = executor.submit(read_google_sheet_data, gc, sheet_url_apps, [worksheet_name_apps])
+            data_emp = future_emp.result()[worksheet_name_emp]
+            data_apps = future_apps.result()[worksheet_name_apps]
 
-        for row in data_apps:
-            print(row)
+        logger.info("emp rows=%d apps rows=%d", len(data_emp), len(data_apps))
 
-        # Import data into PostgreSQL - employee VSA attributes
-        unique_columns_emp = ['email']
-        import_emp_data_to_postgres(data_emp, db_config, table_name_emp, unique_columns_emp)
+        # Check both headers before connecting, so a changed sheet costs no database round trip
+        validate_sheet_header(data_emp, _EMP_COLUMNS, worksheet_name_emp)
+        validate_sheet_header(data_apps, _APP_COLUMNS, worksheet_name_apps)
+
+        # Establish one connection to the PostgreSQL database for both imports
+        conn = psycopg2.connect(**db_config, connect_timeout=10, options='-c statement_timeout=30000')
+        try:
+            # The connection context manager commits both imports together, or rolls back on error
+            with conn:
+                # Import data into PostgreSQL - employee VSA attributes
+                unique_columns_emp = ['email']
+                import_emp_data_to_postgres(data_emp, conn, table_name_emp, unique_columns_emp)
+
+                # Import data into PostgreSQL - VSA app classifications
+                unique_columns_apps = ['name']
+                import_app_data_to_postgres(data_apps, conn, table_name_apps, unique_columns_apps)
+        finally:
+            conn.close()
 
-        # Import data into PostgreSQL - VSA app classifications
-        unique_columns_apps = ['name']
-        import_app_data_to_postgres(data_apps, db_config, table_name_apps, unique_columns_apps)
         return {
             'statusCode': 200,
             'body': json.dumps({'message': 'Success'})
         }
         
     except Exception as e:
-        print(f"Lambda execution failed: {e}")
+        logger.exception("Lambda execution failed")
         return {
             'statusCode': 500,
             'body': json.dumps({'error': str(e)})